@@ -1,12 +1,16 @@
+import json
+import os
 import sys
+from collections import deque
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
-from threading import Lock, Thread
+from threading import Event, Thread, current_thread
 
 import numpy as np
 import sounddevice as sd
 import soundfile as sf
-from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -16,10 +20,11 @@ from PySide6.QtWidgets import (
     QPushButton,
     QScrollArea,
     QSlider,
+    QStyle,
     QVBoxLayout,
     QWidget,
 )
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 APP_STYLE = """
@@ -32,96 +37,280 @@ QPushButton { background-color: deeppink; color: black; border: none; border-rad
 QPushButton:hover { background-color: #ff77cc; }
 QPushButton:pressed { background-color: #ff55aa; }
 QFrame#sectionFrame { background-color: #2A2A2A; border-radius: 8px; padding: 6px; }
+QWidget[selected="true"] { background-color: #333333; border-radius: 5px; }
 """
 
 MUSIC_DIR = Path.home() / "Music"
 EXTENSIONS = {".wav", ".mp3", ".flac"}
+WATCHED_EVENTS = {"created", "deleted", "modified", "moved"}
+DIRECTORY_EVENTS = {"created", "deleted", "moved"}
+META_CACHE_PATH = Path.home() / ".cache" / "music-player" / "meta.json"
+
+# (path, st_mtime_ns, st_size) -> (duration, samplerate, channels)
+_META_CACHE: dict[tuple[str, int, int], tuple[float, int, int]] = {}
+
+
+def load_meta_cache():
+    try:
+        entries = json.loads(META_CACHE_PATH.read_text())
+        for path, mtime, size, duration, samplerate, channels in entries:
+            _META_CACHE[(path, mtime, size)] = (duration, samplerate, channels)
+    except (OSError, ValueError, TypeError):
+        _META_CACHE.clear()
+
+
+def save_meta_cache():
+    entries = [[*key, *meta] for key, meta in _META_CACHE.items()]
+    try:
+        META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        META_CACHE_PATH.write_text(json.dumps(entries))
+    except OSError as e:
+        print(f"Failed to save metadata cache: {e}")
 
 
 class UiSignalBridge(QObject):
     refresh_requested = Signal()
+    scan_result = Signal(list)
+    track_finished = Signal(object)
 
 
-class MusicWatcher(FileSystemEventHandler):
+class MusicWatcher(PatternMatchingEventHandler):
     def __init__(self, ui_signals: UiSignalBridge):
-        super().__init__()
+        super().__init__(
+            patterns=[f"*{ext}" for ext in EXTENSIONS],
+            ignore_directories=True,
+            case_sensitive=False,
+        )
         self.ui_signals = ui_signals
 
+    def dispatch(self, event):
+        # Directory events never match the audio patterns, but moving a
+        # folder out of the library or deleting it is reported only as a
+        # single directory event, so let those through.
+        if event.is_directory:
+            if event.event_type in DIRECTORY_EVENTS:
+                self.ui_signals.refresh_requested.emit()
+            return
+        super().dispatch(event)
+
     def on_any_event(self, event):
-        self.ui_signals.refresh_requested.emit()
+        if event.event_type in WATCHED_EVENTS:
+            self.ui_signals.refresh_requested.emit()
+
+
+class MusicScanner(QRunnable):
+    def __init__(
+        self, scan: Callable[[], list[Path]], ui_signals: UiSignalBridge
+    ):
+        super().__init__()
+        self.scan = scan
+        self.ui_signals = ui_signals
+
+    def run(self):
+        try:
+            tracks = self.scan()
+        except OSError as e:
+            print(f"Failed to scan {MUSIC_DIR}: {e}")
+            tracks = []
+        self.ui_signals.scan_result.emit(tracks)
 
 
 class TrackPlayer:
+    # Stream defaults; a blocksize of 0 lets PortAudio pick the device's
+    # preferred period and the latency setting decides how much it buffers.
+    blocksize = 0
+    latency = "high"
+    # Size of the scratch buffer and of each decoder read.
+    write_seconds = 0.2
+    # Most frames handed to a single stream.write(); pause, seek and
+    # volume changes only take effect between writes.
+    write_block = 4096
+
     def __init__(self, path: Path):
         self.sf = sf.SoundFile(str(path))
         self.samplerate = self.sf.samplerate
         self.channels = self.sf.channels
+        # Mono buffers are kept flat so reads, scaling and writes skip the
+        # extra dimension.
+        frame_shape = () if self.channels == 1 else (self.channels,)
+        self._scratch = np.empty(
+            (int(self.samplerate * self.write_seconds), *frame_shape),
+            dtype=np.float32,
+        )
+        # Two seconds of decoded audio. _write_idx and _read_idx only ever
+        # grow; the decoder thread owns the first, the pump thread the
+        # second.
+        self._ring = np.empty(
+            (self.samplerate * 2, *frame_shape), dtype=np.float32
+        )
+        self._write_idx = 0
+        self._read_idx = 0
+        self._eof = False
+        # (write index, file frame) markers posted by the decoder after a
+        # seek; a deque so the handoff needs no read-then-clear step.
+        self._flushes: deque[tuple[int, int]] = deque()
+        self._data_ready = Event()
+        self._decoder_wake = Event()
         self.stream = None
-        self.lock = Lock()
+        self.pump = None
+        self.decoder = None
+        self._seeks: deque[int] = deque()
         self.volume = 1.0
         self.paused = False
+        self.resumed = Event()
+        self.resumed.set()
+        self.stopping = False
         self.current_frame = 0
         self.finished_callback: Callable[[], None] | None = None
 
-    def callback(self, outdata, frames, time, status):
-        if status:
-            print(status)
-        if self.paused:
-            outdata.fill(0)
-            return
-        with self.lock:
-            data = self.sf.read(frames, dtype="float32", always_2d=True)
-            if len(data) < frames:
-                outdata[: len(data)] = data * self.volume
-                outdata[len(data) :].fill(0)
-                if self.finished_callback:
-                    Thread(target=self.finished_callback, daemon=True).start()
-                raise sd.CallbackStop()
-            else:
-                outdata[:] = data * self.volume
-            self.current_frame = self.sf.tell()
-
-    def play(self):
+    def _decode_loop(self):
+        ring = self._ring
+        size = len(ring)
+        while not self.stopping:
+            self._decoder_wake.clear()
+            # Seeks are queued by the UI thread and only consumed here, so
+            # no lock is held while audio is being produced. Frames decoded
+            # before the seek are flushed by the pump. The requests are only
+            # dropped once _eof and the flush marker are published, so the
+            # pump never sees an ended track with no seek in flight.
+            seeks = len(self._seeks)
+            if seeks:
+                pending = self._seeks[seeks - 1]
+                self.sf.seek(pending)
+                self._eof = False
+                self._flushes.append((self._write_idx, pending))
+                for _ in range(seeks):
+                    self._seeks.popleft()
+            free = size - (self._write_idx - self._read_idx)
+            if self._eof or free == 0:
+                self._decoder_wake.wait()
+                continue
+            start = self._write_idx % size
+            count = min(free, size - start, len(self._scratch))
+            read = len(self.sf.read(out=ring[start : start + count]))
+            self._write_idx += read
+            if read < count:
+                self._eof = True
+            self._data_ready.set()
+
+    # Frames are pushed with blocking writes from a Python thread, so the
+    # PortAudio thread never has to wait on the GIL.
+    def _pump(self):
+        stream = self.stream
+        ring = self._ring
+        size = len(ring)
+        while not self.stopping:
+            self.resumed.wait()
+            if self.stopping:
+                break
+            while True:
+                try:
+                    write_idx, frame = self._flushes.popleft()
+                except IndexError:
+                    break
+                self._read_idx = max(self._read_idx, write_idx)
+                self.current_frame = frame + self._read_idx - write_idx
+                self._decoder_wake.set()
+            self._data_ready.clear()
+            # _eof is published after _write_idx, so check it first.
+            eof = self._eof
+            available = self._write_idx - self._read_idx
+            if available == 0:
+                # Seeks before flushes: the decoder posts in the reverse
+                # order.
+                if eof and not self._seeks and not self._flushes:
+                    self._finish(stream)
+                    break
+                self._data_ready.wait()
+                continue
+            start = self._read_idx % size
+            count = min(
+                available, size - start, self.write_block, len(self._scratch)
+            )
+            block = ring[start : start + count]
+            volume = self.volume
+            if volume != 1.0:
+                # Scale into the scratch buffer in a single pass; at full
+                # volume the ring slice is written out untouched.
+                block = np.multiply(block, volume, out=self._scratch[:count])
+            try:
+                stream.write(block)
+            except sd.PortAudioError:
+                break
+            # Only release the frames once they have been written, since
+            # at full volume the stream reads them straight from the ring.
+            self._read_idx += count
+            self._decoder_wake.set()
+            self.current_frame += count
+
+    def _finish(self, stream):
+        stream.stop()
+        if self.finished_callback and not self.stopping:
+            self.finished_callback()
+
+    def play(self, blocksize: int | None = None, latency=None):
+        self.stopping = False
         self.stream = sd.OutputStream(
             samplerate=self.samplerate,
             channels=self.channels,
-            blocksize=2048,
-            callback=self.callback,
+            dtype="float32",
+            blocksize=self.blocksize if blocksize is None else blocksize,
+            latency=self.latency if latency is None else latency,
         )
+        self.decoder = Thread(target=self._decode_loop, daemon=True)
+        self.decoder.start()
         self.stream.start()
+        self.pump = Thread(target=self._pump, daemon=True)
+        self.pump.start()
 
     def stop(self):
+        self.stopping = True
+        self.resumed.set()
+        self._data_ready.set()
+        self._decoder_wake.set()
+        if self.stream:
+            self.stream.abort()
+        for thread in (self.pump, self.decoder):
+            if thread and thread is not current_thread():
+                thread.join()
+        self.pump = None
+        self.decoder = None
         if self.stream:
-            self.stream.stop()
             self.stream.close()
             self.stream = None
+        self._seeks.clear()
+        self._flushes.clear()
+        self._write_idx = 0
+        self._read_idx = 0
+        self._eof = False
         self.sf.seek(0)
         self.current_frame = 0
 
     def pause(self):
         self.paused = True
+        self.resumed.clear()
 
     def resume(self):
         self.paused = False
+        self.resumed.set()
 
     def set_volume(self, value: int):
-        with self.lock:
-            self.volume = np.clip(value / 100, 0.0, 1.0)
+        self.volume = max(0.0, min(1.0, value / 100))
 
     def seek(self, seconds: float):
         frame = int(seconds * self.samplerate)
-        frame = np.clip(frame, 0, len(self.sf))
-        with self.lock:
-            self.sf.seek(frame)
-            self.current_frame = self.sf.tell()
+        frame = max(0, min(frame, len(self.sf)))
+        self._seeks.append(frame)
+        self.current_frame = frame
+        self._decoder_wake.set()
 
 
 class Track:
     def __init__(self, path: Path):
         self.path = path
         self.player = TrackPlayer(path)
-        with sf.SoundFile(str(path)) as f:
-            self.duration_seconds = len(f) / f.samplerate
+        self.duration_seconds = len(self.player.sf) / self.player.samplerate
+        self.dur_min, self.dur_sec = divmod(int(self.duration_seconds), 60)
 
     def play(self):
         self.player.play()
@@ -148,17 +337,14 @@ class Track:
 class ClickableSlider(QSlider):
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            pos = (
-                event.position().x()
-                if hasattr(event, "position")
-                else event.x()
+            value = QStyle.sliderValueFromPosition(
+                self.minimum(),
+                self.maximum(),
+                int(event.position().x()),
+                self.width(),
             )
-            value = (
-                self.minimum()
-                + (self.maximum() - self.minimum()) * pos / self.width()
-            )
-            self.setValue(int(value))
-            self.sliderMoved.emit(int(value))
+            self.setValue(value)
+            self.sliderMoved.emit(value)
         super().mousePressEvent(event)
 
 
@@ -173,9 +359,23 @@ class MusicPlayer(QMainWindow):
         self.current_volume = 100
         self.user_seeking = False
         self.loop_mode = "none"
+        self.last_progress = (None, -1)
+        self.last_slider_value = -1
+        self.last_time_text = ""
+
+        self.scan_running = False
+        self.rescan_pending = False
+        self.refresh_debounce = QTimer(singleShot=True, interval=250)
+        self.refresh_debounce.timeout.connect(self.start_scan)
 
         self.ui_signals = UiSignalBridge()
-        self.ui_signals.refresh_requested.connect(self.refresh_ui)
+        self.ui_signals.refresh_requested.connect(self.refresh_debounce.start)
+        self.ui_signals.scan_result.connect(self.refresh_ui)
+        # Emitted from the player's pump thread; queue it onto the GUI
+        # thread, where the next track is started.
+        self.ui_signals.track_finished.connect(
+            self.on_track_finished, Qt.ConnectionType.QueuedConnection
+        )
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -220,9 +420,11 @@ class MusicPlayer(QMainWindow):
         for btn in [self.loop_none_btn, self.loop_list_btn, self.loop_song_btn]:
             loop_layout.addWidget(btn)
 
-        self.loop_none_btn.clicked.connect(lambda: self.set_loop_mode("none"))
-        self.loop_list_btn.clicked.connect(lambda: self.set_loop_mode("list"))
-        self.loop_song_btn.clicked.connect(lambda: self.set_loop_mode("song"))
+        self.loop_none_btn.setProperty("loop_mode", "none")
+        self.loop_list_btn.setProperty("loop_mode", "list")
+        self.loop_song_btn.setProperty("loop_mode", "song")
+        for btn in [self.loop_none_btn, self.loop_list_btn, self.loop_song_btn]:
+            btn.clicked.connect(self.on_loop_clicked)
 
         self.set_loop_mode("none")
 
@@ -246,7 +448,11 @@ class MusicPlayer(QMainWindow):
 
         self.track_rows = {}
         self.play_buttons = {}
+        self.row_pool = []
+        self.selected_row = None
         self.track_list = []
+        self.meta_save_scheduled = False
+        load_meta_cache()
 
         # ── File watcher
         self.watcher = Observer()
@@ -258,11 +464,11 @@ class MusicPlayer(QMainWindow):
 
         # ── Timer for progress updates
         self.timer = QTimer()
-        self.timer.setInterval(50)
+        self.timer.setInterval(250)
         self.timer.timeout.connect(self.update_progress)
         self.timer.start()
 
-        self.refresh_ui()
+        self.start_scan()
 
     # ── Loop Mode
     def set_loop_mode(self, mode):
@@ -280,100 +486,184 @@ class MusicPlayer(QMainWindow):
             active_style if mode == "song" else inactive_style
         )
 
+    def on_loop_clicked(self):
+        self.set_loop_mode(self.sender().property("loop_mode"))
+
     # ── Music scan
     def scan_music(self):
-        return [
-            p
-            for p in MUSIC_DIR.rglob("*")
-            if p.is_file() and p.suffix.lower() in EXTENSIONS
-        ]
-
-    def refresh_ui(self):
-        self.track_list = self.scan_music()
-        for i in reversed(range(self.scroll_layout.count())):
-            w = self.scroll_layout.itemAt(i).widget()
-            if w:
-                w.setParent(None)
+        # DirEntry caches the type from the directory listing, so this
+        # avoids a stat() per entry; only symlinks are followed for files.
+        tracks = []
+        stack = [str(MUSIC_DIR)]
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot >= 0 and name[dot:].lower() in EXTENSIONS:
+                            tracks.append(Path(entry.path))
+        return tracks
+
+    def start_scan(self):
+        if self.scan_running:
+            self.rescan_pending = True
+            return
+        self.scan_running = True
+        QThreadPool.globalInstance().start(
+            MusicScanner(self.scan_music, self.ui_signals)
+        )
+
+    def refresh_ui(self, track_list: list[Path]):
+        self.scan_running = False
+        if self.rescan_pending:
+            self.rescan_pending = False
+            self.start_scan()
+        self.track_list = track_list
         self.track_rows.clear()
         self.play_buttons.clear()
-        for path in self.track_list:
-            self.add_song_row(path)
+        # Rows are recycled: existing widgets are rebound to the new list
+        # and surplus ones are hidden so later refreshes can reuse them.
+        for i, path in enumerate(self.track_list):
+            if i == len(self.row_pool):
+                self.row_pool.append(self.add_song_row())
+            self.bind_song_row(self.row_pool[i], path)
+        for binding in self.row_pool[len(self.track_list) :]:
+            binding["row"].hide()
+
+        if self.current_track:
+            self.highlight_track(self.current_track.path)
+            if self.current_track.player.paused:
+                self.update_play_buttons(None)
+        else:
+            self.highlight_track(None)
 
-    def add_song_row(self, path: Path):
+    def add_song_row(self) -> dict:
         row = QWidget()
+        row.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         layout = QHBoxLayout(row)
         layout.setSpacing(12)
 
-        title = QLabel(path.stem)
+        title = QLabel()
         title.setFixedWidth(320)
         layout.addWidget(title)
 
-        try:
-            with sf.SoundFile(str(path)) as f:
-                duration = len(f) / f.samplerate
-                minutes = int(duration // 60)
-                seconds = int(duration % 60)
-                time_label = QLabel(f"{minutes}:{seconds:02}")
-        except Exception:
-            time_label = QLabel("--:--")
+        time_label = QLabel()
         layout.addWidget(time_label)
 
         play_btn = QPushButton("▶")
         play_btn.setFixedSize(48, 32)
         layout.addWidget(play_btn)
+        play_btn.clicked.connect(self.on_play_clicked)
 
         self.scroll_layout.addWidget(row)
-        self.track_rows[path] = row
-        self.play_buttons[path] = play_btn
-
-        def toggle_play(_=None, p=path):
-            if self.current_track and self.current_track.path == p:
-                if self.current_track.player.paused:
-                    self.current_track.resume()
-                    self.update_play_buttons(p)
-                else:
-                    self.current_track.pause()
-                    self.update_play_buttons(None)
+        return {
+            "row": row,
+            "title": title,
+            "time_label": time_label,
+            "play_btn": play_btn,
+        }
+
+    def bind_song_row(self, binding: dict, path: Path):
+        binding["title"].setText(path.stem)
+        try:
+            duration = self.track_duration(path)
+            minutes = int(duration // 60)
+            seconds = int(duration % 60)
+            binding["time_label"].setText(f"{minutes}:{seconds:02}")
+        except Exception:
+            binding["time_label"].setText("--:--")
+        binding["play_btn"].setProperty("track_path", str(path))
+        binding["row"].show()
+
+        self.track_rows[path] = binding["row"]
+        self.play_buttons[path] = binding["play_btn"]
+
+    def on_play_clicked(self):
+        path = Path(self.sender().property("track_path"))
+        if self.current_track and self.current_track.path == path:
+            if self.current_track.player.paused:
+                self.current_track.resume()
+                self.update_play_buttons(path)
             else:
-                self.play_track(p)
+                self.current_track.pause()
+                self.update_play_buttons(None)
+        else:
+            self.play_track(path)
 
-        play_btn.clicked.connect(toggle_play)
+    def track_duration(self, path: Path) -> float:
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        meta = _META_CACHE.get(key)
+        if meta is None:
+            info = sf.info(str(path))
+            meta = (
+                info.frames / info.samplerate,
+                info.samplerate,
+                info.channels,
+            )
+            _META_CACHE[key] = meta
+            if not self.meta_save_scheduled:
+                self.meta_save_scheduled = True
+                QTimer.singleShot(0, self.save_meta)
+        return meta[0]
+
+    def save_meta(self):
+        self.meta_save_scheduled = False
+        live = {str(p) for p in self.track_list}
+        for key in [k for k in _META_CACHE if k[0] not in live]:
+            del _META_CACHE[key]
+        save_meta_cache()
 
     def update_play_buttons(self, active_path: Path | None):
         for path, btn in self.play_buttons.items():
             btn.setText("⏸" if path == active_path else "▶")
 
-    def highlight_track(self, path: Path):
-        for p, w in self.track_rows.items():
-            w.setStyleSheet("")
-        if path in self.track_rows:
-            self.track_rows[path].setStyleSheet(
-                "background-color: #333333; border-radius: 5px;"
-            )
+    def highlight_track(self, path: Path | None):
+        # Only the previously and newly selected rows are restyled, via the
+        # "selected" property rule in APP_STYLE.
+        row = self.track_rows.get(path)
+        if row is not self.selected_row:
+            if self.selected_row is not None:
+                self.set_row_selected(self.selected_row, False)
+            if row is not None:
+                self.set_row_selected(row, True)
+            self.selected_row = row
         self.update_play_buttons(path)
 
+    def set_row_selected(self, row: QWidget, selected: bool):
+        row.setProperty("selected", selected)
+        row.style().unpolish(row)
+        row.style().polish(row)
+
     def play_track(self, path: Path):
         if self.current_track:
             self.current_track.stop()
             self.current_track = None
-            self.progress_slider.setValue(0)
-            self.time_label.setText("00:00 / 00:00")
+            self.reset_progress()
         try:
             track = Track(path)
             track.set_volume(self.current_volume)
-
-            def on_finished():
-                self.on_track_finished(path)
-
-            track.player.finished_callback = on_finished
-            Thread(target=track.play, daemon=True).start()
+            track.player.finished_callback = partial(
+                self.ui_signals.track_finished.emit, track
+            )
+            track.play()
             self.current_track = track
             self.progress_slider.setEnabled(True)
             self.highlight_track(path)
         except Exception as e:
             print(f"Failed to play {path.name}: {e}")
 
-    def on_track_finished(self, path: Path):
+    def on_track_finished(self, track: Track):
+        if track is not self.current_track:
+            return
+        path = track.path
         if self.loop_mode == "song":
             self.play_track(path)
         elif self.loop_mode == "list":
@@ -384,9 +674,9 @@ class MusicPlayer(QMainWindow):
             except ValueError:
                 pass
         else:
+            track.stop()
             self.current_track = None
-            self.progress_slider.setValue(0)
-            self.time_label.setText("00:00 / 00:00")
+            self.reset_progress()
             self.update_play_buttons(None)
 
     def on_volume_change(self, value: int):
@@ -396,21 +686,36 @@ class MusicPlayer(QMainWindow):
             self.current_track.set_volume(value)
 
     def update_progress(self):
-        if self.current_track and not self.user_seeking:
-            pos_sec = self.current_track.get_position()
-            duration_sec = self.current_track.duration_seconds
-            slider_value = int(pos_sec / duration_sec * 1000)
+        track = self.current_track
+        if track is None or self.user_seeking:
+            return
+        progress = (track, track.player.current_frame)
+        if progress == self.last_progress:
+            return
+        self.last_progress = progress
+
+        pos_sec = track.get_position()
+        slider_value = int(pos_sec / track.duration_seconds * 1000)
+        if slider_value != self.last_slider_value:
+            self.last_slider_value = slider_value
             self.progress_slider.blockSignals(True)
             self.progress_slider.setValue(slider_value)
             self.progress_slider.blockSignals(False)
 
-            cur_min = int(pos_sec // 60)
-            cur_sec = int(pos_sec % 60)
-            dur_min = int(duration_sec // 60)
-            dur_sec = int(duration_sec % 60)
-            self.time_label.setText(
-                f"{cur_min}:{cur_sec:02} / {dur_min}:{dur_sec:02}"
-            )
+        cur_min, cur_sec = divmod(int(pos_sec), 60)
+        time_text = (
+            f"{cur_min}:{cur_sec:02} / {track.dur_min}:{track.dur_sec:02}"
+        )
+        if time_text != self.last_time_text:
+            self.last_time_text = time_text
+            self.time_label.setText(time_text)
+
+    def reset_progress(self):
+        self.last_progress = (None, -1)
+        self.last_slider_value = 0
+        self.last_time_text = "00:00 / 00:00"
+        self.progress_slider.setValue(0)
+        self.time_label.setText(self.last_time_text)
 
     def start_seek(self):
         self.user_seeking = True